@@ -8,6 +8,7 @@ from .config import (
     AI_BASE_URL,
     TELEGRAM_BOT_TOKEN,
     TELEGRAM_CHAT_ID,
+    TELEGRAPH_ACCESS_TOKEN,
     PROJECT_ROOT,
     DIGEST_LOG_PATH,
     API_DEBUG_LOG_PATH,
@@ -24,6 +25,7 @@ __all__ = [
     'AI_BASE_URL',
     'TELEGRAM_BOT_TOKEN',
     'TELEGRAM_CHAT_ID',
+    'TELEGRAPH_ACCESS_TOKEN',
     'PROJECT_ROOT',
     'DIGEST_LOG_PATH',
     'API_DEBUG_LOG_PATH',
@@ -2,33 +2,46 @@
 # -*- coding: utf-8 -*-
 
 import os
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 from pathlib import Path
 
 # 确定项目根目录
-PROJECT_ROOT = Path(__file__).parent.parent.parent
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
-# Load environment variables from .env file if it exists
+# Snapshot the environment once at import; values from the .env file (if it
+# exists) take precedence. Bare `KEY` lines (value None) are ignored so they
+# don't mask a real environment variable. .env values are only visible
+# through this module, not exported to os.environ.
 env_path = Path(__file__).parent / '.env'
-if env_path.exists():
-    load_dotenv(dotenv_path=env_path, override=True)
+_dotenv = dotenv_values(env_path) if env_path.exists() else {}
+_env = {**os.environ, **{k: v for k, v in _dotenv.items() if v is not None}}
+
+
+def _get(key: str, default: str = None) -> str:
+    """Look up a config value from the cached environment snapshot."""
+    value = _env.get(key)
+    return default if value is None else value
+
 
 # FreshRSS database configuration
-FRESHRSS_DB_PATH = os.getenv('FRESHRSS_DB_PATH')
-USERNAME = os.getenv('USERNAME')
-HOURS_BACK = int(os.getenv('HOURS_BACK', "8"))
+FRESHRSS_DB_PATH = _get('FRESHRSS_DB_PATH')
+USERNAME = _get('USERNAME')
+HOURS_BACK = int(_get('HOURS_BACK', "8"))
 
 # AI API configuration
-AI_API_KEY = os.getenv('GEMINI_API_KEY')
-_stage2_primary = os.getenv('GEMINI_STAGE2_MODEL_ID')
-_stage2_legacy = os.getenv('GEMINI_MODEL_ID')
+AI_API_KEY = _get('GEMINI_API_KEY')
+_stage2_primary = _get('GEMINI_STAGE2_MODEL_ID')
+_stage2_legacy = _get('GEMINI_MODEL_ID')
 AI_STAGE2_MODEL = _stage2_primary or _stage2_legacy
-AI_STAGE1_MODEL = os.getenv('GEMINI_STAGE1_MODEL_ID') or AI_STAGE2_MODEL
-AI_BASE_URL = os.getenv('GEMINI_BASE_URL')  
+AI_STAGE1_MODEL = _get('GEMINI_STAGE1_MODEL_ID') or AI_STAGE2_MODEL
+AI_BASE_URL = _get('GEMINI_BASE_URL')
 
 # Telegram Bot configuration
-TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN')
-TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
+TELEGRAM_BOT_TOKEN = _get('TELEGRAM_BOT_TOKEN')
+TELEGRAM_CHAT_ID = _get('TELEGRAM_CHAT_ID')
+
+# Telegraph configuration
+TELEGRAPH_ACCESS_TOKEN = _get('TELEGRAPH_ACCESS_TOKEN')
 
 # 日志配置
 LOG_DIR = PROJECT_ROOT / 'logs'
@@ -36,4 +49,4 @@ DIGEST_LOG_PATH = LOG_DIR / 'rss-digest.log'
 API_DEBUG_LOG_PATH = LOG_DIR / 'api_debug.log'
 
 # Stage-1 (per-article) concurrency
-STAGE1_MAX_WORKERS = int(os.getenv('STAGE1_MAX_WORKERS', '20'))
+STAGE1_MAX_WORKERS = int(_get('STAGE1_MAX_WORKERS', '20'))
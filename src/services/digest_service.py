@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import contextlib
+import functools
 import logging
+import os
+import time
 from typing import Dict, List, Any
 import datetime
-import json
+
+import orjson
 
 # 导入项目模块
 from src.config import (
@@ -40,40 +45,74 @@ class DigestGenerationError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=1)
+def _get_ai_processor() -> AIProcessor:
+    """Return the shared AI processor so retries reuse one API client."""
+    return AIProcessor(
+        api_key=AI_API_KEY,
+        stage2_model=AI_STAGE2_MODEL,
+        base_url=AI_BASE_URL,
+        stage1_model=AI_STAGE1_MODEL,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _get_telegram_sender() -> TelegramSender:
+    """Return the shared Telegram sender used for digests and failure notices."""
+    return TelegramSender(
+        bot_token=TELEGRAM_BOT_TOKEN,
+        chat_id=TELEGRAM_CHAT_ID
+    )
+
+
+# In-process caches of the parsed history/processed-ID files (populated lazily)
+_digest_history_cache: list[str] | None = None
+_processed_entries_cache: list[dict] | None = None
+
+
 def _load_digest_history() -> list[str]:
-    """Load recent digest history for deduplication."""
+    """Load recent digest history for deduplication (cached after first read)."""
+    global _digest_history_cache
+    if _digest_history_cache is not None:
+        return _digest_history_cache
+    history = []
     try:
-        if DIGEST_HISTORY_FILE.exists():
-            with open(DIGEST_HISTORY_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    return data
+        with open(DIGEST_HISTORY_FILE, 'rb') as f:
+            data = orjson.loads(f.read())
+        if isinstance(data, list):
+            history = data
+    except FileNotFoundError:
+        pass
     except Exception as e:
         logger.error(f"Failed to load digest history: {e}")
-    return []
+    _digest_history_cache = history
+    return _digest_history_cache
 
 
 def _save_digest_to_history(digest: str):
     """Save digest to history, keeping only the most recent N entries."""
+    global _digest_history_cache
     try:
         history = _load_digest_history()
-        # Add new digest to the beginning
+        # Add new digest to the beginning and keep only the most recent N entries
         history.insert(0, digest)
-        # Keep only the most recent N entries
-        history = history[:DIGEST_HISTORY_LIMIT]
+        del history[DIGEST_HISTORY_LIMIT:]
         # Write back to file
-        with open(DIGEST_HISTORY_FILE, 'w', encoding='utf-8') as f:
-            json.dump(history, f, ensure_ascii=False, indent=2)
+        with open(DIGEST_HISTORY_FILE, 'wb') as f:
+            f.write(orjson.dumps(history, option=orjson.OPT_INDENT_2))
         logger.info(f"Saved digest to history. Total history entries: {len(history)}")
     except Exception as e:
+        # Drop the cache so the next load re-reads the on-disk state
+        _digest_history_cache = None
         logger.error(f"Failed to save digest to history: {e}")
 
-def generate_digest(entries: List[Dict[Any, Any]]) -> str:
+def generate_digest(entries: List[Dict[Any, Any]], digest_history: list[str] = None) -> str:
     """
     Generate a digest from the RSS entries
 
     Args:
         entries: List of entry dictionaries
+        digest_history: Recent digests for deduplication (loaded from history if None)
 
     Returns:
         Generated digest text including timestamp header
@@ -85,22 +124,17 @@ def generate_digest(entries: List[Dict[Any, Any]]) -> str:
         f"Generating digest from {len(entries)} entries using two-stage pipeline"
     )
 
-    # Initialize AI processor
-    ai_processor = AIProcessor(
-        api_key=AI_API_KEY,
-        stage2_model=AI_STAGE2_MODEL,
-        base_url=AI_BASE_URL,
-        stage1_model=AI_STAGE1_MODEL,
-    )
+    ai_processor = _get_ai_processor()
     # Stage 1: summarize each article individually
     logger.info("Stage1: Summarizing each article individually...")
     merged_summaries, url_map = ai_processor.summarize_articles(entries)
     if not merged_summaries or not merged_summaries.strip():
         raise DigestGenerationError("Stage1 produced no summaries.")
 
-    # Load digest history for deduplication
-    digest_history = _load_digest_history()
-    logger.info(f"Loaded {len(digest_history)} historical digests for deduplication")
+    # Load digest history for deduplication unless the caller passed it in
+    if digest_history is None:
+        digest_history = _load_digest_history()
+    logger.info(f"Using {len(digest_history)} historical digests for deduplication")
 
     # Stage 2: finalize digest from stage1 abstracts
     logger.info("Stage2: Finalizing digest from per-article summaries...")
@@ -109,7 +143,8 @@ def generate_digest(entries: List[Dict[Any, Any]]) -> str:
         digest_history=digest_history,
         url_map=url_map,
     )
-    if not ai_generated_digest or not ai_generated_digest.strip():
+    ai_generated_digest = (ai_generated_digest or "").strip()
+    if not ai_generated_digest:
         raise DigestGenerationError("Stage2 returned empty content.")
 
     # Format the current datetime
@@ -136,33 +171,46 @@ def send_digest(digest_text: str) -> Dict[str, Any]:
     """
     logger.info("Sending digest via Telegram (using Telegraph)")
 
-    telegram = TelegramSender(
-        bot_token=TELEGRAM_BOT_TOKEN,
-        chat_id=TELEGRAM_CHAT_ID
-    )
+    return _get_telegram_sender().send_message(digest_text)
+
+def _load_processed_entries() -> list[dict]:
+    """Load processed {id, ts} entries (cached after first read).
+
+    Old-format files ([id, ...]) are migrated using the current time as ts.
+    """
+    global _processed_entries_cache
+    if _processed_entries_cache is not None:
+        return _processed_entries_cache
+    entries = []
+    try:
+        with open(PROCESSED_IDS_FILE, 'rb') as f:
+            data = orjson.loads(f.read())
+    except FileNotFoundError:
+        data = []
+    if isinstance(data, list):
+        if data and isinstance(data[0], dict):
+            # New {id, ts} format
+            entries = data
+        else:
+            # Backward compat: migrate old [id, ...] format
+            now_ts = int(time.time())
+            entries = [{"id": eid, "ts": now_ts} for eid in data]
+    _processed_entries_cache = entries
+    return _processed_entries_cache
 
-    return telegram.send_message(digest_text)
 
 def _update_processed_ids(entry_ids: List[int], hours_back: int = None):
     """Helper function to update the processed IDs file incrementally and clean old IDs.
 
     Uses {id, ts} structure for reliable timestamp-based pruning.
     """
-    now_ts = int(datetime.datetime.now().timestamp())
+    global _processed_entries_cache
+    now_ts = int(time.time())
     pruning_hours = max(48, (hours_back or HOURS_BACK) * 2)
+    tmp_path = PROCESSED_IDS_FILE.with_suffix('.tmp')
 
     try:
-        existing_entries = []
-        if PROCESSED_IDS_FILE.exists():
-            with open(PROCESSED_IDS_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    if data and isinstance(data[0], dict):
-                        # New {id, ts} format
-                        existing_entries = data
-                    else:
-                        # Backward compat: migrate old [id, ...] format
-                        existing_entries = [{"id": eid, "ts": now_ts} for eid in data]
+        existing_entries = _load_processed_entries()
 
         # Build set of existing IDs for dedup
         existing_id_set = {entry["id"] for entry in existing_entries}
@@ -176,14 +224,19 @@ def _update_processed_ids(entry_ids: List[int], hours_back: int = None):
         all_entries = existing_entries + new_entries
 
         # Prune old entries
-        cutoff_ts = int((datetime.datetime.now() - datetime.timedelta(hours=pruning_hours)).timestamp())
+        cutoff_ts = now_ts - pruning_hours * 3600
         filtered_entries = [entry for entry in all_entries if entry["ts"] >= cutoff_ts]
 
-        # Write back to file
-        with open(PROCESSED_IDS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(filtered_entries, f, ensure_ascii=False, indent=4)
+        # Write back atomically (compact: the file is only machine-read)
+        tmp_path.write_bytes(orjson.dumps(filtered_entries))
+        os.replace(tmp_path, PROCESSED_IDS_FILE)
+        _processed_entries_cache = filtered_entries
         logger.info(f"Successfully updated processed IDs file with {len(filtered_entries)} entries (pruning window: {pruning_hours}h): {PROCESSED_IDS_FILE}")
     except Exception as e:
+        # Drop the cache so the next run re-reads the on-disk state
+        _processed_entries_cache = None
+        with contextlib.suppress(OSError):
+            tmp_path.unlink(missing_ok=True)
         logger.error(f"Failed to update processed IDs file {PROCESSED_IDS_FILE}: {e}")
 
 def run_digest_process(hours_back: int = None, send: bool = True) -> str:
@@ -207,7 +260,7 @@ def run_digest_process(hours_back: int = None, send: bool = True) -> str:
     entries = get_recent_entries(
         db_path=FRESHRSS_DB_PATH,
         hours_back=hours_back,
-        processed_ids_file_path=str(PROCESSED_IDS_FILE)
+        processed_ids_file_path=PROCESSED_IDS_FILE
     )
 
     if not entries:
@@ -217,6 +270,9 @@ def run_digest_process(hours_back: int = None, send: bool = True) -> str:
 
     logger.info(f"Found {len(entries)} new entries in the past {hours_back} hours (after filtering)")
 
+    # Load digest history once for all attempts
+    digest_history = _load_digest_history()
+
     # Attempt digest generation with retry
     max_attempts = 2
     last_error = None
@@ -224,7 +280,7 @@ def run_digest_process(hours_back: int = None, send: bool = True) -> str:
     for attempt in range(1, max_attempts + 1):
         logger.info(f"Generating digest attempt {attempt}/{max_attempts}")
         try:
-            digest = generate_digest(entries)
+            digest = generate_digest(entries, digest_history=digest_history)
             break  # Success
         except DigestGenerationError as e:
             last_error = e
@@ -241,8 +297,7 @@ def run_digest_process(hours_back: int = None, send: bool = True) -> str:
     if last_error and not digest:
         logger.error(f"Digest generation failed after {max_attempts} attempts. Not updating processed IDs.")
         if send:
-            telegram = TelegramSender(bot_token=TELEGRAM_BOT_TOKEN, chat_id=TELEGRAM_CHAT_ID)
-            telegram.send_message(f"Digest generation failed after {max_attempts} attempts. Error: {last_error}")
+            _get_telegram_sender().send_message(f"Digest generation failed after {max_attempts} attempts. Error: {last_error}")
         return ""
 
     # Digest generated successfully
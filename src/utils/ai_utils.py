@@ -4,9 +4,9 @@
 import json
 import logging
 import logging.handlers
-import os
 import re
 import datetime
+from pathlib import Path
 from typing import Dict, List, Any, Union
 from openai import OpenAI
 import time
@@ -27,14 +27,15 @@ api_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname
 api_logger.addHandler(api_handler)
 api_logger.setLevel(logging.DEBUG)
 
+# system prompt 文件所在目录
+_PROMPT_DIR = Path(__file__).resolve().parent
+
 # 读取 system prompt 内容（第二阶段：全局汇总）
 SYSTEM_PROMPT = "你是一位资深新闻编辑，擅长从大量资讯中提取核心信息并生成摘要。"  # Default fallback
 try:
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    prompt_path = os.path.join(script_dir, "system_prompt.md")
-    if os.path.exists(prompt_path):
-        with open(prompt_path, "r", encoding="utf-8") as f:
-            SYSTEM_PROMPT = f.read()
+    prompt_path = _PROMPT_DIR / "system_prompt.md"
+    if prompt_path.exists():
+        SYSTEM_PROMPT = prompt_path.read_text(encoding="utf-8")
         logger.info(f"Successfully loaded system prompt from {prompt_path}")
     else:
         logger.error(f"System prompt file '{prompt_path}' not found. Using default prompt.")
@@ -64,11 +65,9 @@ STAGE1_SYSTEM_PROMPT = (
     "[分类: AI, Smartphone]"
 )
 try:
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    prompt_path_stage1 = os.path.join(script_dir, "system_prompt_stage1.md")
-    if os.path.exists(prompt_path_stage1):
-        with open(prompt_path_stage1, "r", encoding="utf-8") as f:
-            STAGE1_SYSTEM_PROMPT = f.read()
+    prompt_path_stage1 = _PROMPT_DIR / "system_prompt_stage1.md"
+    if prompt_path_stage1.exists():
+        STAGE1_SYSTEM_PROMPT = prompt_path_stage1.read_text(encoding="utf-8")
         logger.info(f"Successfully loaded stage1 system prompt from {prompt_path_stage1}")
     else:
         logger.info(
@@ -122,8 +121,6 @@ class AIProcessor:
         from src.config import STAGE1_MAX_WORKERS  # import here to avoid early import side-effects
 
         def worker(i: int, e: Dict[str, Any]):
-            # Create a lightweight client per thread for safety
-            local_client = OpenAI(base_url=self.base_url, api_key=self.api_key)
             title = e.get('title', 'N/A')
             source = e.get('feed_name', 'N/A')
             link = e.get('link', '')
@@ -135,7 +132,8 @@ class AIProcessor:
             max_attempts = 2
             for attempt in range(1, max_attempts + 1):
                 try:
-                    completion = local_client.chat.completions.create(
+                    # The OpenAI client is thread-safe; share its connection pool
+                    completion = self.client.chat.completions.create(
                         model=self.stage1_model,
                         messages=[
                             {"role": "system", "content": STAGE1_SYSTEM_PROMPT},
@@ -178,8 +176,8 @@ class AIProcessor:
             futures = [executor.submit(worker, idx, entry) for idx, entry in enumerate(entries, start=1)]
             for fut in as_completed(futures):
                 i, title, source, link, per_article = fut.result()
-                # Filter out empty or [SKIP] results
-                if not per_article or per_article.strip() == "[SKIP]":
+                # Filter out empty or [SKIP] results (worker output is already stripped)
+                if not per_article or per_article == "[SKIP]":
                     skipped += 1
                     api_logger.debug(f"Stage1 skipped article {i}: '{title[:60]}'")
                     continue
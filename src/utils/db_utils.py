@@ -4,11 +4,13 @@
 import sqlite3
 import datetime
 import re
+import time
 from typing import List, Dict, Any
 from bs4 import BeautifulSoup, MarkupResemblesLocatorWarning
 import warnings
-import json
-import os
+from pathlib import Path
+
+import orjson
 
 # Ignore the specific BeautifulSoup warning about URLs resembling file paths
 warnings.filterwarnings("ignore", category=MarkupResemblesLocatorWarning)
@@ -47,7 +49,7 @@ def clean_html_content(html_content: str) -> str:
     lines = [line.strip() for line in text.splitlines() if line.strip()]
     return '\n'.join(lines)
 
-def get_recent_entries(db_path: str, hours_back: int = 48, processed_ids_file_path: str = None) -> List[Dict[Any, Any]]:
+def get_recent_entries(db_path: str, hours_back: int = 48, processed_ids_file_path: Path = None) -> List[Dict[Any, Any]]:
     """
     Retrieve entries from the past few hours from the FreshRSS database,
     excluding entries that have been processed before.
@@ -61,10 +63,10 @@ def get_recent_entries(db_path: str, hours_back: int = 48, processed_ids_file_pa
         List of dictionaries containing feed entries with their content
     """
     processed_entry_ids = set()
-    if processed_ids_file_path and os.path.exists(processed_ids_file_path):
+    if processed_ids_file_path:
         try:
-            with open(processed_ids_file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(processed_ids_file_path, 'rb') as f:
+                data = orjson.loads(f.read())
                 if isinstance(data, list):
                     if data and isinstance(data[0], dict):
                         # New {id, ts} format
@@ -72,13 +74,12 @@ def get_recent_entries(db_path: str, hours_back: int = 48, processed_ids_file_pa
                     else:
                         # Old [id, ...] format
                         processed_entry_ids = set(data)
-        except json.JSONDecodeError:
-            pass
-        except Exception:
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            # Missing or corrupt file: treat as no processed IDs
             pass
 
     # Calculate timestamp for N hours ago
-    timestamp = int((datetime.datetime.now() - datetime.timedelta(hours=hours_back)).timestamp())
+    timestamp = int(time.time()) - hours_back * 3600
     
     # Connect to the database
     conn = sqlite3.connect(db_path)
@@ -13,6 +13,16 @@ from src.utils.telegraph_utils import create_telegraph_page
 # 创建命名记录器
 logger = logging.getLogger(__name__)
 
+# Standard Markdown **bold**
+_BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+# Markdown [text](url), allowing one level of nested parentheses in URLs (e.g. Wikipedia)
+# Pattern: [^()]* matches non-parens, (?:\([^()]*\)[^()]*)* matches balanced (...)
+_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^()]*(?:\([^()]*\)[^()]*)*)\)')
+# MarkdownV2 special characters: _ * [ ] ( ) ~ ` > # + - = | { } . !
+_MDV2_ESCAPE_RE = re.compile(r'([_*\[\]()~`>#+=|{}.!-])')
+# Split points for long messages: double newline, then single newline
+_MESSAGE_SPLIT_RE = re.compile(r'(\n\n|\n)')
+
 def _convert_markdown_bold_to_telegram(text: str) -> tuple[str, list[str]]:
     """
     Convert standard Markdown **bold** to Telegram MarkdownV2 bold markers.
@@ -26,8 +36,7 @@ def _convert_markdown_bold_to_telegram(text: str) -> tuple[str, list[str]]:
         # Use a placeholder that won't be escaped
         return f"\x00BOLD{len(bold_segments)-1}\x00"
 
-    # Match **text** (standard Markdown bold)
-    result = re.sub(r'\*\*([^*]+)\*\*', replace_bold, text)
+    result = _BOLD_RE.sub(replace_bold, text)
     return result, bold_segments
 
 
@@ -44,9 +53,7 @@ def _convert_markdown_links_to_telegram(text: str) -> tuple[str, list[tuple[str,
         links.append((display_text, url))
         return f"\x00LINK{len(links)-1}\x00"
 
-    # Match [text](url) - handle one level of nested parentheses in URLs (e.g. Wikipedia)
-    # Pattern: [^()]* matches non-parens, (?:\([^()]*\)[^()]*)* matches balanced (...)
-    result = re.sub(r'\[([^\]]+)\]\(([^()]*(?:\([^()]*\)[^()]*)*)\)', replace_link, text)
+    result = _LINK_RE.sub(replace_link, text)
     return result, links
 
 
@@ -58,22 +65,20 @@ def _escape_markdown_v2_content(text: str) -> str:
     # Then, extract and protect bold segments
     text_with_placeholders, bold_segments = _convert_markdown_bold_to_telegram(text_with_link_placeholders)
 
-    # Characters to escape: _ * [ ] ( ) ~ ` > # + - = | { } . !
-    escape_chars_pattern = r'([_*\[\]()~`>#+=|{}.!-])'
     # Escape the characters by adding a preceding \
-    escaped_text = re.sub(escape_chars_pattern, r'\\\1', text_with_placeholders)
+    escaped_text = _MDV2_ESCAPE_RE.sub(r'\\\1', text_with_placeholders)
 
     # Restore bold segments with proper Telegram MarkdownV2 formatting
     for i, content in enumerate(bold_segments):
         # Escape the content inside bold markers
-        escaped_content = re.sub(escape_chars_pattern, r'\\\1', content)
+        escaped_content = _MDV2_ESCAPE_RE.sub(r'\\\1', content)
         # Replace placeholder with Telegram bold format: *text*
         escaped_text = escaped_text.replace(f"\x00BOLD{i}\x00", f"*{escaped_content}*")
 
     # Restore links with proper MarkdownV2 format
     for i, (display_text, url) in enumerate(links):
         # Escape display text
-        escaped_display = re.sub(escape_chars_pattern, r'\\\1', display_text)
+        escaped_display = _MDV2_ESCAPE_RE.sub(r'\\\1', display_text)
         # Escape special chars in URL (only ) and \)
         escaped_url = url.replace('\\', '\\\\').replace(')', '\\)')
         escaped_text = escaped_text.replace(f"\x00LINK{i}\x00", f"[{escaped_display}]({escaped_url})")
@@ -123,6 +128,8 @@ class TelegramSender:
         self.bot_token = bot_token
         self.chat_id = chat_id
         self.api_url = f"https://api.telegram.org/bot{bot_token}"
+        # Reuse one connection pool across chunks and repeated sends
+        self.session = requests.Session()
         
     def _send_single_message(self, text: str, parse_mode: str) -> Dict[str, Any]:
         """Internal method to send a single message chunk."""
@@ -135,7 +142,7 @@ class TelegramSender:
             data["parse_mode"] = parse_mode
 
         try:
-            response = requests.post(endpoint, data=data)
+            response = self.session.post(endpoint, data=data)
             result = response.json()
             if not result.get("ok"):
                 error_msg = f"Failed to send Telegram message chunk: {result.get('description', 'Unknown error')} for text starting with: {text[:50]}..."
@@ -204,7 +211,7 @@ class TelegramSender:
         # Split primarily by double newline, then single newline, then space
         chunks = []
         # Split carefully to avoid breaking mid-escape sequence or formatting
-        potential_splits = re.split(r'(\n\n|\n)', processed_text)
+        potential_splits = _MESSAGE_SPLIT_RE.split(processed_text)
 
         temp_chunk = ""
         for part in potential_splits:
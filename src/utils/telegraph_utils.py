@@ -6,7 +6,7 @@ Telegraph publishing utilities for RSS Digest.
 Creates Telegraph pages for long content with preserved hyperlinks.
 """
 
-import os
+import functools
 import re
 import logging
 from html import escape as html_escape
@@ -14,28 +14,32 @@ from urllib.parse import urlparse
 from telegraph import Telegraph
 from requests.exceptions import RequestException
 
+from src.config import TELEGRAPH_ACCESS_TOKEN
+
 logger = logging.getLogger(__name__)
 
-# Environment variable name for Telegraph token
-TELEGRAPH_TOKEN_ENV = "TELEGRAPH_ACCESS_TOKEN"
+# Combined pattern for inline bold (**text**) and links ([text](url))
+_INLINE_MD_RE = re.compile(r'\*\*([^*]+)\*\*|\[([^\]]+)\]\(([^)]+)\)')
 
 
+@functools.lru_cache(maxsize=1)
 def _get_telegraph_client() -> Telegraph:
     """
-    Get Telegraph client using environment variable token.
+    Get Telegraph client using the configured access token.
 
     If token is not set, creates a new account and logs the token
-    for the user to save.
+    for the user to save. The client is cached so later pages reuse
+    the same account and HTTP session.
     """
-    token = os.getenv(TELEGRAPH_TOKEN_ENV)
+    token = TELEGRAPH_ACCESS_TOKEN
 
     if token:
-        logger.debug("Using Telegraph token from environment variable")
+        logger.debug("Using Telegraph token from config (TELEGRAPH_ACCESS_TOKEN)")
         return Telegraph(access_token=token)
 
     # Create new account and prompt user to save token
     logger.warning(
-        f"No {TELEGRAPH_TOKEN_ENV} found in environment. "
+        "No TELEGRAPH_ACCESS_TOKEN found in config or src/config/.env. "
         "Creating new Telegraph account..."
     )
     telegraph = Telegraph()
@@ -44,7 +48,7 @@ def _get_telegraph_client() -> Telegraph:
 
     logger.warning(
         f"New Telegraph account created. Please add to your .env file:\n"
-        f"{TELEGRAPH_TOKEN_ENV}={new_token}"
+        f"TELEGRAPH_ACCESS_TOKEN={new_token}"
     )
 
     return Telegraph(access_token=new_token)
@@ -59,47 +63,89 @@ def _is_safe_url(url: str) -> bool:
         return False
 
 
-def _process_inline_formatting(text: str) -> str:
+def _process_inline_formatting(text: str, out: list[str]) -> None:
     """
     Process inline Markdown formatting to HTML with proper escaping.
 
+    HTML fragments are appended directly to ``out`` (the caller's buffer)
+    rather than joined into an intermediate string.
+
     Handles:
     - **bold** -> <strong>bold</strong>
     - [text](url) -> <a href="url">text</a> (with URL validation)
     - Escapes HTML special characters in regular text
     """
-    result = []
     pos = 0
 
-    # Combined pattern for bold and links
-    pattern = re.compile(r'\*\*([^*]+)\*\*|\[([^\]]+)\]\(([^)]+)\)')
-
-    for match in pattern.finditer(text):
+    for match in _INLINE_MD_RE.finditer(text):
         # Add escaped text before this match
         if match.start() > pos:
-            result.append(html_escape(text[pos:match.start()]))
+            out.append(html_escape(text[pos:match.start()]))
 
         if match.group(1):  # Bold: **text**
-            result.append(f'<strong>{html_escape(match.group(1))}</strong>')
+            out.append(f'<strong>{html_escape(match.group(1))}</strong>')
         elif match.group(2) and match.group(3):  # Link: [text](url)
             link_text = html_escape(match.group(2))
             url = match.group(3)
             if _is_safe_url(url):
                 # Escape URL for HTML attribute
                 safe_url = html_escape(url, quote=True)
-                result.append(f'<a href="{safe_url}">{link_text}</a>')
+                out.append(f'<a href="{safe_url}">{link_text}</a>')
             else:
                 # Unsafe URL, just show the text
                 logger.warning(f"Skipping unsafe URL: {url[:50]}...")
-                result.append(link_text)
+                out.append(link_text)
 
         pos = match.end()
 
     # Add remaining text
     if pos < len(text):
-        result.append(html_escape(text[pos:]))
+        out.append(html_escape(text[pos:]))
+
+
+def _emit_title(text: str, out: list[str], in_list: bool) -> bool:
+    """Skip top-level title (# ...) - Telegraph page already has title."""
+    return in_list
+
+
+def _emit_heading(text: str, out: list[str], in_list: bool) -> bool:
+    """## Heading -> <h4>Heading</h4>, closing any open list."""
+    if in_list:
+        out.append('</ul>')
+    out.append('<h4>')
+    _process_inline_formatting(text, out)
+    out.append('</h4>')
+    return False
+
+
+def _emit_bullet(text: str, out: list[str], in_list: bool) -> bool:
+    """- bullet -> <li>bullet</li>, opening a list if needed."""
+    if not in_list:
+        out.append('<ul>')
+    out.append('<li>')
+    _process_inline_formatting(text, out)
+    out.append('</li>')
+    return True
+
 
-    return ''.join(result)
+def _emit_paragraph(text: str, out: list[str], in_list: bool) -> bool:
+    """Regular paragraph -> <p>text</p>, closing any open list."""
+    if in_list:
+        out.append('</ul>')
+    out.append('<p>')
+    _process_inline_formatting(text, out)
+    out.append('</p>')
+    return False
+
+
+# Line handlers keyed by leading marker: marker -> (marker length, handler).
+# Each handler appends HTML for the line and returns the new in-list state.
+_LINE_HANDLERS = {
+    '## ': (3, _emit_heading),
+    '# ': (2, _emit_title),
+    '- ': (2, _emit_bullet),
+}
+_PARAGRAPH_HANDLER = (0, _emit_paragraph)
 
 
 def _markdown_to_telegraph_html(markdown_text: str) -> str:
@@ -127,33 +173,13 @@ def _markdown_to_telegraph_html(markdown_text: str) -> str:
             html_parts.append('<p><br/></p>')
             continue
 
-        # Skip top-level title (# ...) - Telegraph page already has title
-        if stripped.startswith('# ') and not stripped.startswith('## '):
-            continue
-
-        # Handle headings
-        if stripped.startswith('## '):
-            if in_list:
-                html_parts.append('</ul>')
-                in_list = False
-            content = _process_inline_formatting(stripped[3:])
-            html_parts.append(f'<h4>{content}</h4>')
-
-        # Handle bullet points
-        elif stripped.startswith('- '):
-            if not in_list:
-                html_parts.append('<ul>')
-                in_list = True
-            content = _process_inline_formatting(stripped[2:])
-            html_parts.append(f'<li>{content}</li>')
-
-        # Regular paragraph
-        else:
-            if in_list:
-                html_parts.append('</ul>')
-                in_list = False
-            content = _process_inline_formatting(stripped)
-            html_parts.append(f'<p>{content}</p>')
+        # Look up the 3-char marker first so '## ' wins over '# '
+        marker_len, handler = (
+            _LINE_HANDLERS.get(stripped[:3])
+            or _LINE_HANDLERS.get(stripped[:2])
+            or _PARAGRAPH_HANDLER
+        )
+        in_list = handler(stripped[marker_len:], html_parts, in_list)
 
     # Close any open list
     if in_list:
@@ -0,0 +1,8 @@
+import tempfile
+from pathlib import Path
+
+import src.config
+
+# src.utils.ai_utils attaches a file handler to API_DEBUG_LOG_PATH at import
+# time; point it at a temp dir so tests don't write into the source tree
+src.config.API_DEBUG_LOG_PATH = Path(tempfile.mkdtemp()) / 'api_debug.log'
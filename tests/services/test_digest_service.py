@@ -0,0 +1,100 @@
+import time
+
+import orjson
+import pytest
+
+from src.services import digest_service
+
+
+@pytest.fixture
+def ids_file(tmp_path, monkeypatch):
+    path = tmp_path / "processed_entry_ids.json"
+    monkeypatch.setattr(digest_service, "PROCESSED_IDS_FILE", path)
+    monkeypatch.setattr(digest_service, "_processed_entries_cache", None)
+    return path
+
+
+def _read(path):
+    return orjson.loads(path.read_bytes())
+
+
+def test_update_creates_file_without_leftover_tmp(ids_file):
+    digest_service._update_processed_ids([1, 2], hours_back=8)
+
+    assert [e["id"] for e in _read(ids_file)] == [1, 2]
+    assert list(ids_file.parent.iterdir()) == [ids_file]
+
+
+def test_update_migrates_old_list_format(ids_file):
+    ids_file.write_bytes(orjson.dumps([1, 2]))
+
+    digest_service._update_processed_ids([2, 3], hours_back=8)
+
+    entries = _read(ids_file)
+    assert [e["id"] for e in entries] == [1, 2, 3]
+    assert all(isinstance(e["ts"], int) for e in entries)
+
+
+def test_update_prunes_expired_entries_regardless_of_order(ids_file):
+    now = int(time.time())
+    ids_file.write_bytes(orjson.dumps([
+        {"id": 1, "ts": now - 3600},
+        {"id": 2, "ts": now - 100 * 3600},
+        {"id": 3, "ts": now - 3600},
+    ]))
+
+    digest_service._update_processed_ids([3, 9], hours_back=8)
+
+    assert [e["id"] for e in _read(ids_file)] == [1, 3, 9]
+
+
+def test_update_leaves_corrupt_file_untouched(ids_file):
+    ids_file.write_bytes(b"{not json")
+
+    digest_service._update_processed_ids([1], hours_back=8)
+
+    assert ids_file.read_bytes() == b"{not json"
+    assert list(ids_file.parent.iterdir()) == [ids_file]
+
+
+def test_update_removes_tmp_when_replace_fails(ids_file, monkeypatch):
+    def fail_replace(src, dst):
+        raise OSError("replace failed")
+
+    monkeypatch.setattr(digest_service.os, "replace", fail_replace)
+
+    digest_service._update_processed_ids([1], hours_back=8)
+
+    assert not ids_file.exists()
+    assert not ids_file.with_suffix(".tmp").exists()
+
+
+def test_update_survives_failed_tmp_cleanup(ids_file, monkeypatch):
+    def fail(*args, **kwargs):
+        raise PermissionError("read-only")
+
+    monkeypatch.setattr(digest_service.os, "replace", fail)
+    monkeypatch.setattr(type(ids_file), "unlink", fail)
+
+    digest_service._update_processed_ids([1], hours_back=8)
+
+    assert not ids_file.exists()
+
+
+def test_run_digest_process_without_send(ids_file, monkeypatch):
+    class FakeProcessor:
+        def summarize_articles(self, entries):
+            return "summaries", {}
+
+        def finalize_digest_from_article_summaries(self, merged, digest_history=None, url_map=None):
+            return "## AI\n- item\n"
+
+    monkeypatch.setattr(digest_service, "get_recent_entries", lambda **kwargs: [{"id": 7}])
+    monkeypatch.setattr(digest_service, "_get_ai_processor", FakeProcessor)
+    monkeypatch.setattr(digest_service, "_digest_history_cache", [])
+
+    digest = digest_service.run_digest_process(hours_back=8, send=False)
+
+    assert digest.startswith("# RSS 新闻摘要 - ")
+    assert digest.endswith("\n\n## AI\n- item")
+    assert [e["id"] for e in _read(ids_file)] == [7]
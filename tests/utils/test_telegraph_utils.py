@@ -0,0 +1,46 @@
+from src.utils.telegraph_utils import _markdown_to_telegraph_html
+
+
+def test_title_is_skipped_and_heading_rendered():
+    html = _markdown_to_telegraph_html("# RSS 新闻摘要 - 2026/01/01 10:00\n## AI\ntext")
+    assert html == "<h4>AI</h4><p>text</p>"
+
+
+def test_bullets_open_and_close_list():
+    md = "## AI\n- one\n- two\nafter\n- three"
+    assert _markdown_to_telegraph_html(md) == (
+        "<h4>AI</h4><ul><li>one</li><li>two</li></ul>"
+        "<p>after</p><ul><li>three</li></ul>"
+    )
+
+
+def test_blank_line_closes_list():
+    assert _markdown_to_telegraph_html("- a\n\n- b") == (
+        "<ul><li>a</li></ul><p><br/></p><ul><li>b</li></ul>"
+    )
+
+
+def test_heading_closes_list_and_title_keeps_it_open():
+    assert _markdown_to_telegraph_html("- a\n# Title\n- b\n## Next") == (
+        "<ul><li>a</li><li>b</li></ul><h4>Next</h4>"
+    )
+
+
+def test_inline_bold_links_and_escaping():
+    md = "- **OpenAI** ships [post](https://x.com/a?b=1&c=2) <b>"
+    assert _markdown_to_telegraph_html(md) == (
+        '<ul><li><strong>OpenAI</strong> ships '
+        '<a href="https://x.com/a?b=1&amp;c=2">post</a> &lt;b&gt;</li></ul>'
+    )
+
+
+def test_unsafe_link_renders_text_only():
+    html = _markdown_to_telegraph_html("see [click](javascript:alert1)")
+    assert html == "<p>see click</p>"
+
+
+def test_lines_without_marker_space_are_paragraphs():
+    md = "### Deep\n##NoSpace\n#tag\n-- dash\n-"
+    assert _markdown_to_telegraph_html(md) == (
+        "<p>### Deep</p><p>##NoSpace</p><p>#tag</p><p>-- dash</p><p>-</p>"
+    )